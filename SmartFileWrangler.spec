@@ -1,12 +1,18 @@
 # -*- mode: python ; coding: utf-8 -*-
+import os
+import subprocess
+import sys
 
+# Compile main_window.ui to smart_file_wrangler/ui_main_window.py first, so
+# the frozen app builds its window without parsing the .ui at startup
+subprocess.run([sys.executable, os.path.join(SPECPATH, 'build_ui.py')], check=True)
 
 a = Analysis(
     ['src\\smart_file_wrangler\\gui.py'],
     pathex=['src'],
     binaries=[],
     datas=[('src/smart_file_wrangler/main_window.ui', '.')],
-    hiddenimports=[],
+    hiddenimports=['smart_file_wrangler.ui_main_window'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
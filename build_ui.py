@@ -0,0 +1,40 @@
+"""
+build_ui.py
+
+Build helper that compiles the Qt Designer file into Python code.
+
+Runs:
+    pyside6-uic src/smart_file_wrangler/main_window.ui
+        -o src/smart_file_wrangler/ui_main_window.py
+
+Run this before packaging (and after editing main_window.ui) so the GUI
+can build its widgets directly instead of parsing the .ui XML at startup.
+If the generated module is missing, gui.py falls back to QUiLoader.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+PACKAGE_DIR = Path(__file__).resolve().parent / "src" / "smart_file_wrangler"
+UI_FILE = PACKAGE_DIR / "main_window.ui"
+OUTPUT_FILE = PACKAGE_DIR / "ui_main_window.py"
+
+
+def main():
+    command = ["pyside6-uic", str(UI_FILE), "-o", str(OUTPUT_FILE)]
+    try:
+        subprocess.run(command, check=True)
+    except FileNotFoundError:
+        print("pyside6-uic not found (install PySide6 first)")
+        return 1
+    except subprocess.CalledProcessError as error:
+        print(f"pyside6-uic failed with exit code {error.returncode}")
+        return error.returncode
+
+    print(f'UI module written: "{OUTPUT_FILE}"')
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
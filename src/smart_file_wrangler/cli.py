@@ -18,34 +18,214 @@ All business logic remains in pipeline and subsystem modules.
 # Standard library imports
 # ----------------------------------------------------------------------
 
-import argparse
+import copy
+import os
+import stat
+import sys
+from enum import IntFlag
+from functools import lru_cache
 from pathlib import Path
+from types import SimpleNamespace
 
 # ----------------------------------------------------------------------
 # Local imports
 # ----------------------------------------------------------------------
+# Config and the pipeline are imported inside run_cli() after argument
+# parsing, so `--help` and argument errors never load the subsystems.
 
-from .config import Config
-from .pipeline import run_pipeline
 from .logger import init_logger, log
 
 
+# ----------------------------------------------------------------------
+# Fast-path argument parsing
+# ----------------------------------------------------------------------
+# Flag -> (destination, kind). Kinds:
+#   "flag"   - store_true switch
+#   "value"  - takes one string value
+#   "int"    - takes one integer value
+#   "append" - takes one value, may be repeated
+# Must stay in sync with the argparse groups registered by _build_parser().
+_FAST_FLAGS = {
+    "-i": ("input", "value"),
+    "--input": ("input", "value"),
+    "-o": ("output", "value"),
+    "--output": ("output", "value"),
+    "--config-file": ("config_file", "value"),
+    "--organise": ("organise", "flag"),
+    "--move": ("move", "flag"),
+    "--organise-by": ("organise_by", "value"),
+    "--contains": ("contains", "append"),
+    "--starts-with": ("starts_with", "append"),
+    "--subfolders": ("subfolders", "flag"),
+    "--report-format": ("report_format", "value"),
+    "--folder-tree": ("folder_tree", "flag"),
+    "--thumbnails": ("thumbnails", "flag"),
+    "--thumb-size": ("thumb_size", "int"),
+    "--verbose": ("verbose", "flag"),
+    "--report-only": ("report_only", "flag"),
+    "--thumbnails-only": ("thumbnails_only", "flag"),
+}
+
+
+class ReportFormat(IntFlag):
+    """Report outputs selected by `--report-format`, as bit flags."""
+
+    NONE = 0
+    CSV = 1
+    JSON = 2
+    EXCEL = 4
+    ALL = CSV | JSON | EXCEL
+
+
+# --report-format value -> ReportFormat flags
+_REPORT_FORMATS = {
+    "csv": ReportFormat.CSV,
+    "json": ReportFormat.JSON,
+    "excel": ReportFormat.EXCEL,
+    "all": ReportFormat.ALL,
+    "none": ReportFormat.NONE,
+}
+
+# Accepted values for options with argparse `choices`.
+# frozensets give a single hash probe per check; argparse keeps its own
+# ordered lists so --help shows the choices in a stable order.
+_FAST_CHOICES = {
+    "organise_by": frozenset({"media_type", "extension", "string_rule"}),
+    "report_format": frozenset(_REPORT_FORMATS),
+}
+
+
+def _fast_parse(argv):
+    """
+    Parse the common CLI invocations without building an ArgumentParser.
+
+    Args:
+        argv (list[str]): Arguments without the program name.
+
+    Returns:
+        SimpleNamespace | None: The same attributes argparse would produce,
+        or None if anything unusual is seen (help, unknown or abbreviated
+        flags, `--flag=value`, bad values, missing `--input`). The caller
+        then falls back to argparse, which also produces the error message.
+    """
+    args = SimpleNamespace(
+        input=None,
+        output=None,
+        config_file=None,
+        organise=False,
+        move=False,
+        organise_by=None,
+        contains=[],
+        starts_with=[],
+        subfolders=False,
+        report_format="csv",
+        folder_tree=False,
+        thumbnails=False,
+        thumb_size=512,
+        verbose=False,
+        report_only=False,
+        thumbnails_only=False,
+    )
+
+    tokens = iter(argv)
+    for token in tokens:
+        spec = _FAST_FLAGS.get(token)
+        if spec is None:
+            return None
+
+        dest, kind = spec
+        if kind == "flag":
+            setattr(args, dest, True)
+            continue
+
+        value = next(tokens, None)
+        if value is None or value.startswith("-"):
+            return None
+
+        if kind == "int":
+            try:
+                value = int(value)
+            except ValueError:
+                return None
+        elif dest in _FAST_CHOICES and value not in _FAST_CHOICES[dest]:
+            return None
+
+        if kind == "append":
+            getattr(args, dest).append(value)
+        else:
+            setattr(args, dest, value)
+
+    # Missing --input and conflicting shortcuts are reported by argparse
+    if args.input is None or (args.report_only and args.thumbnails_only):
+        return None
+
+    return args
+
+
 # ----------------------------------------------------------------------
 # Argument parsing
 # ----------------------------------------------------------------------
 
-def parse_args():
+def parse_args(argv=None):
     """
     Parse CLI arguments for Smart File Wrangler.
+
+    Common invocations are handled by `_fast_parse()`; argparse is only
+    built for `--help` and for anything the fast path does not accept.
+
+    Returns a namespace with no business logic applied. Results are cached
+    per argv, so the namespace is shared and must be treated as read-only.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+
+    return _parse_cached(tuple(argv))
+
+
+@lru_cache(maxsize=16)
+def _parse_cached(argv):
+    """
+    Parse an argv tuple (cached for hosts that re-run the same arguments).
+
+    Invalid arguments exit via SystemExit, which is never cached.
+    """
+    argv = list(argv)
+
+    args = _fast_parse(argv)
+    if args is not None:
+        return args
+
+    return _parse_with_argparse(argv)
+
+
+def _parse_with_argparse(argv):
+    """
+    Parse CLI arguments with the full argparse definition.
     Returns an argparse.Namespace with no business logic applied.
     """
-    parser = argparse.ArgumentParser(
-        description="Smart File Wrangler - Modular media automation tool."
+    return _build_parser(_help_requested(argv)).parse_args(argv)
+
+
+def _help_requested(argv):
+    """
+    Return True if argv asks for help (`-h`, `--help` or an abbreviation
+    argparse would accept, such as `--he`).
+    """
+    return any(
+        arg == "-h" or (len(arg) > 2 and "--help".startswith(arg))
+        for arg in argv
     )
 
-    # --------------------------------------------------------------
-    # Core paths
-    # --------------------------------------------------------------
+
+# ----------------------------------------------------------------------
+# Argument groups (full argparse definition)
+# ----------------------------------------------------------------------
+# Each helper registers one group of related options. argparse is only
+# built on the fallback path (--help, errors, unusual input), where all
+# groups are needed for complete usage and error messages.
+
+def _add_path_args(parser):
+    """Input/output paths and the optional config file."""
     parser.add_argument(
         "-i", "--input",
         required=True,
@@ -56,10 +236,15 @@ def parse_args():
         default=None,
         help="Output folder for reports (default: input folder)"
     )
+    parser.add_argument(
+        "--config-file",
+        default=None,
+        help="JSON file of Config settings; replaces all other options except --input"
+    )
 
-    # --------------------------------------------------------------
-    # Organiser options
-    # --------------------------------------------------------------
+
+def _add_organiser_args(parser):
+    """Organiser switches, mode and filename rules."""
     parser.add_argument(
         "--organise",
         action="store_true",
@@ -90,21 +275,21 @@ def parse_args():
         help="Organise files whose names start with this string (can be repeated)"
     )
 
-    # --------------------------------------------------------------
-    # Scanning options
-    # --------------------------------------------------------------
+
+def _add_scan_args(parser):
+    """Folder scanning options."""
     parser.add_argument(
         "--subfolders",
         action="store_true",
         help="Include subfolders when scanning"
     )
 
-    # --------------------------------------------------------------
-    # Reporting options
-    # --------------------------------------------------------------
+
+def _add_report_args(parser):
+    """Report format and folder tree options."""
     parser.add_argument(
         "--report-format",
-        choices=["csv", "json", "excel", "all", "none"],
+        choices=list(_REPORT_FORMATS),
         default="csv",
         help="Report output format"
     )
@@ -114,9 +299,9 @@ def parse_args():
         help="Output a text-based folder tree"
     )
 
-    # --------------------------------------------------------------
-    # Thumbnail options
-    # --------------------------------------------------------------
+
+def _add_thumbnail_args(parser):
+    """Thumbnail generation options."""
     parser.add_argument(
         "--thumbnails",
         action="store_true",
@@ -129,9 +314,9 @@ def parse_args():
         help="Thumbnail size in pixels"
     )
 
-    # --------------------------------------------------------------
-    # Logging
-    # --------------------------------------------------------------
+
+def _add_logging_args(parser):
+    """Logging options."""
     # Enable verbose logs globally (includes debug, warnings, and UI/file sinks if configured).
     parser.add_argument(
         "--verbose",
@@ -139,134 +324,255 @@ def parse_args():
         help="Verbose logging"
     )
 
-    # --------------------------------------------------------------
-    # Workflow shortcuts
-    # --------------------------------------------------------------
-    parser.add_argument(
+
+def _add_workflow_args(parser):
+    """Mutually exclusive workflow shortcuts."""
+    workflow = parser.add_mutually_exclusive_group()
+    workflow.add_argument(
         "--report-only",
         action="store_true",
         help="Run only report generation"
     )
-    parser.add_argument(
+    workflow.add_argument(
         "--thumbnails-only",
         action="store_true",
         help="Run only thumbnail generation"
     )
 
-    return parser.parse_args()
+
+_ARGUMENT_GROUPS = (
+    _add_path_args,
+    _add_organiser_args,
+    _add_scan_args,
+    _add_report_args,
+    _add_thumbnail_args,
+    _add_logging_args,
+    _add_workflow_args,
+)
+
+
+@lru_cache(maxsize=2)
+def _build_parser(with_help=True):
+    """
+    Build the full ArgumentParser for Smart File Wrangler.
+
+    Args:
+        with_help (bool): Add `-h/--help` and the description. Only needed
+            when help was requested; error reporting uses the usage line.
+
+    Each variant is built once per process and reused, so long-running
+    hosts that call run_cli() repeatedly only pay for parsing.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description=(
+            "Smart File Wrangler - Modular media automation tool."
+            if with_help else None
+        ),
+        add_help=with_help,
+    )
+
+    for add_group in _ARGUMENT_GROUPS:
+        add_group(parser)
+
+    return parser
 
 
 # ----------------------------------------------------------------------
-# CLI execution
+# Config construction
 # ----------------------------------------------------------------------
 
-def run_cli():
+def build_config(argv):
     """
-    Command-line entry point for Smart File Wrangler.
+    Build a Config from CLI arguments.
 
-    Responsibilities (thin orchestration only):
-    - Parses command line arguments
-    - Constructs a Config object using its internal defaults
-    - Applies CLI overrides into Config
-    - Invokes the pipeline exactly once
+    Args:
+        argv (tuple[str, ...]): Arguments without the program name.
+
+    Returns:
+        Config: A new Config; options not given keep the Config defaults.
 
     Notes:
-        - The legacy `Defaults` dictionary has been removed from runtime use.
-        - This module does not contain business logic.
-        - Public pipeline behavior is preserved.
+        - Argument parsing and override resolution are cached per argv,
+          so hosts that re-run the CLI with the same arguments (tests,
+          GUI previews) skip that work.
+        - Config is mutable, so a fresh instance (with its own rule list)
+          is built on every call rather than sharing a cached one.
     """
-    args = parse_args()
+    from .config import Config
 
-    # Initialise logging early
-    init_logger(verbose=args.verbose)
+    settings = dict(_config_settings(tuple(argv)))
 
-    input_folder = Path(args.input)
-    if not input_folder.exists() or not input_folder.is_dir():
-        raise ValueError(f"Input folder not found: {input_folder}")
+    rules = settings.pop("filename_rules", None)
+    if rules:
+        settings["filename_rules"] = [
+            {"type": rule_type, "value": value} for rule_type, value in rules
+        ]
 
-    # --------------------------------------------------------------
-    # Construct Config instance (internal defaults only, no Defaults dict)
-    # --------------------------------------------------------------
-    config = Config()
+    return Config(**settings)
 
-    # Core scanning
-    config.recurse_subfolders = args.subfolders
 
-    # Logging
-    config.verbose = args.verbose
+@lru_cache(maxsize=8)
+def _config_settings(argv):
+    """
+    Resolve CLI arguments into Config keyword arguments.
+
+    Cached per argv tuple. Filename rules are returned as a tuple of
+    (type, value) pairs; the returned dict is shared between calls and
+    must be treated as read-only.
+    """
+    args = parse_args(argv)
 
-    # Organiser
-    config.enable_organiser = args.organise or args.move
-    config.move_files = args.move
     # --------------------------------------------------------------
-    # Organiser configuration
+    # Workflow shortcuts (mutually exclusive)
     # --------------------------------------------------------------
+    # The shortcut decides the stage switches up front, so each switch
+    # is assigned exactly once. argparse rejects using both shortcuts.
+    if args.thumbnails_only:
+        enable_organiser = False
+        generate_thumbnails = True
+
+        output_csv = output_json = output_excel = output_tree = False
+    else:
+        # Organiser and thumbnails (both disabled by --report-only)
+        enable_organiser = (args.organise or args.move) and not args.report_only
+        generate_thumbnails = args.thumbnails and not args.report_only
+
+        # Reporting ("all" sets every flag, so no special case is needed)
+        report_format = _REPORT_FORMATS[args.report_format]
+        output_csv = bool(report_format & ReportFormat.CSV)
+        output_json = bool(report_format & ReportFormat.JSON)
+        output_excel = bool(report_format & ReportFormat.EXCEL)
+        output_tree = args.folder_tree
+
+    report_output_dir = os.path.normpath(args.output) if args.output else None
+
+    settings = {
+        "recurse_subfolders": args.subfolders,
+        "verbose": args.verbose,
+        "enable_organiser": enable_organiser,
+        "move_files": args.move,
+        "generate_thumbnails": generate_thumbnails,
+        "thumb_size": args.thumb_size,
+        "output_csv": output_csv,
+        "output_json": output_json,
+        "output_excel": output_excel,
+        "output_tree": output_tree,
+        "report_output_dir": report_output_dir,
+    }
+
+    # Unset options keep Config defaults
     if args.organise_by:
-        config.organiser_mode = args.organise_by
+        # Interned so the organiser's per-item mode checks against string
+        # literals hit the identity fast path of str ==
+        settings["organiser_mode"] = sys.intern(args.organise_by)
 
     # Build filename rules only if needed
-    rules = []
+    rules = tuple(("contains", value) for value in args.contains)
+    rules += tuple(("starts_with", value) for value in args.starts_with)
+    if rules:
+        settings["filename_rules"] = rules
 
-    for value in args.contains:
-        rules.append({
-            "type": "contains",
-            "value": value,
-        })
+    return settings
 
-    for value in args.starts_with:
-        rules.append({
-            "type": "starts_with",
-            "value": value,
-        })
 
-    if rules:
-        config.filename_rules = rules
-
-    # Thumbnails
-    config.generate_thumbnails = args.thumbnails
-    config.thumb_size = args.thumb_size
-
-    # Reporting
-    config.output_csv = False
-    config.output_json = False
-    config.output_excel = False
-    config.output_tree = args.folder_tree
-
-    if args.report_format == "csv":
-        config.output_csv = True
-    elif args.report_format == "json":
-        config.output_json = True
-    elif args.report_format == "excel":
-        config.output_excel = True
-    elif args.report_format == "all":
-        config.output_csv = True
-        config.output_json = True
-        config.output_excel = True
-
-    config.report_output_dir = (
-        str(Path(args.output)) if args.output else None
-    )
+def _config_from_file(path):
+    """
+    Build a Config from a JSON file of Config field values.
 
-    # --------------------------------------------------------------
-    # Workflow shortcuts (mutually exclusive)
-    # --------------------------------------------------------------
-    if args.report_only and args.thumbnails_only:
-        raise ValueError(
-            "Choose only one: --report-only OR --thumbnails-only"
-        )
+    Args:
+        path (str): Path to a JSON object such as
+            {"recurse_subfolders": true, "output_excel": false}
 
-    if args.report_only:
-        config.enable_organiser = False
-        config.generate_thumbnails = False
+    Returns:
+        Config: Config with the file's values; missing keys keep defaults.
 
-    if args.thumbnails_only:
-        config.enable_organiser = False
-        config.generate_thumbnails = True
+    Raises:
+        ValueError: If the file is missing, is not a JSON object, or
+            contains keys that are not Config fields.
+    """
+    from .config import Config
+
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        raise ValueError(f"Config file not found: {path}")
+
+    # The parsed dict is cached and shared; each Config gets its own copy
+    # of the lists/dicts in it (e.g. filename_rules), so mutating one
+    # Config never leaks into the next run
+    values = copy.deepcopy(_load_config_file(os.path.abspath(path), mtime_ns))
+
+    try:
+        return Config(**values)
+    except TypeError as exc:
+        raise ValueError(f"Invalid config file {path}: {exc}")
+
+
+@lru_cache(maxsize=8)
+def _load_config_file(path, mtime_ns):
+    """
+    Read and parse a JSON config file.
+
+    Cached by (absolute path, modification time), so a long-running host
+    only re-parses the file after it changes. The returned dict is shared
+    between calls and must be treated as read-only; _config_from_file()
+    deep-copies it before building a Config.
+    """
+    import json
+
+    with open(path, "rb") as config_file:
+        values = json.load(config_file)
+
+    if not isinstance(values, dict):
+        raise ValueError(f"Config file must contain a JSON object: {path}")
+
+    return values
+
+
+# ----------------------------------------------------------------------
+# CLI execution
+# ----------------------------------------------------------------------
+
+def run_cli():
+    """
+    Command-line entry point for Smart File Wrangler.
+
+    Responsibilities (thin orchestration only):
+    - Parses command line arguments
+    - Resolves CLI overrides into a Config via `build_config()`
+      (options not given on the command line keep Config defaults),
+      or loads the Config from `--config-file` instead
+    - Invokes the pipeline exactly once
+
+    Notes:
+        - The legacy `Defaults` dictionary has been removed from runtime use.
+        - This module does not contain business logic.
+        - Public pipeline behavior is preserved.
+    """
+    argv = tuple(sys.argv[1:])
+    args = parse_args(argv)
+
+    # Deferred import: only paid once arguments are valid
+    from .pipeline import run_pipeline
+
+    # One stat() call covers both "exists" and "is a directory"
+    input_folder = Path(args.input)
+    try:
+        input_stat = os.stat(input_folder)
+    except OSError:
+        raise ValueError(f"Input folder not found: {input_folder}")
+    if not stat.S_ISDIR(input_stat.st_mode):
+        raise ValueError(f"Input folder not found: {input_folder}")
+
+    if args.config_file:
+        config = _config_from_file(args.config_file)
+    else:
+        config = build_config(argv)
 
-        config.output_csv = False
-        config.output_json = False
-        config.output_excel = False
-        config.output_tree = False
+    # Initialise logging once the effective verbosity is known
+    init_logger(verbose=config.verbose)
 
     # --------------------------------------------------------------
     # Run pipeline
@@ -14,14 +14,79 @@ This module contains configuration only — no runtime logic.
 # Standard library imports
 # ----------------------------------------------------------------------
 
-from dataclasses import dataclass, field
-from typing import List, Optional, Dict
+import sys
+from dataclasses import dataclass
+from enum import IntFlag
+
+
+__all__ = ("Config", "MediaType", "MEDIA_TYPE_FLAGS", "METADATA_FIELDS")
+
+
+# ----------------------------------------------------------------------
+# Shared default values
+# ----------------------------------------------------------------------
+# Built once at import. The names are used as dict keys for every file
+# during metadata extraction and reporting, so they are interned and
+# shared by all Config instances instead of being rebuilt per Config.
+
+# Default file extensions to scan (without leading dots)
+_FILE_TYPES = ("mp4", "png", "wav", "jpg")
+
+# Default metadata fields (immutable, so no default_factory is needed).
+# Public so callers can extend it without building a Config, e.g.
+# dataclasses.replace(config, metadata_fields=METADATA_FIELDS + ("x",))
+METADATA_FIELDS = tuple(
+    sys.intern(name)
+    for name in (
+        "file_path",
+        "file_size",
+        "media_type",
+        "extension",
+        "resolution_px",
+        "duration_seconds",
+        "sample_rate_hz",
+        "mode",
+        "format",
+        "frame_count",
+        "middle_frame_number",
+        "start_frame",
+        "end_frame",
+    )
+)
+
+
+# ----------------------------------------------------------------------
+# Media type flags
+# ----------------------------------------------------------------------
+
+class MediaType(IntFlag):
+    """
+    Media categories as bit flags.
+
+    `Config.media_mask` combines these, so including a category is a
+    single bitwise AND per file instead of a dict lookup.
+    """
+
+    IMAGE = 1
+    VIDEO = 2
+    AUDIO = 4
+    OTHER = 8
+    ALL = IMAGE | VIDEO | AUDIO | OTHER
+
+
+# Metadata `media_type` string -> flag (keys interned; used per file)
+MEDIA_TYPE_FLAGS = {
+    sys.intern("image"): MediaType.IMAGE,
+    sys.intern("video"): MediaType.VIDEO,
+    sys.intern("audio"): MediaType.AUDIO,
+    sys.intern("other"): MediaType.OTHER,
+}
 
 
 # ----------------------------------------------------------------------
 # Config
 # ----------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class Config:
     """
     Runtime configuration for a single Smart File Wrangler run.
@@ -29,6 +94,13 @@ class Config:
     This dataclass holds settings for **one folder processing run**.
     The legacy global `Defaults` dictionary was removed from runtime use.
     `Config` contains no media logic — it is only a passive container.
+
+    `slots=True` gives fixed attribute storage (no per-instance `__dict__`),
+    so only the fields declared below can be set. The GUI still updates
+    fields in place, which is why the class is not frozen.
+
+    Fields are keyword-only, and collection defaults are shared immutable
+    tuples, so building a Config runs no default factories.
     """
 
     # ------------------------------------------------------------------
@@ -39,7 +111,7 @@ class Config:
     recurse_subfolders: bool = True
 
     # File extensions to include when scanning (without leading dots)
-    file_types: List[str] = field(default_factory=lambda: ["mp4", "png", "wav", "jpg"])
+    file_types: tuple[str, ...] = _FILE_TYPES
 
     # Whether to group frame sequences into logical units
     combine_frame_seq: bool = True
@@ -47,6 +119,14 @@ class Config:
     # Ignore generated thumbnail folders during scanning
     ignore_thumbnail_folders: bool = True
 
+    # Threads used to list folders during recursive scans
+    # 1 = serial walk; higher values help on slow or network storage
+    scan_workers: int = 1
+
+    # POSIX only: walk folders with bytes paths so file names are not
+    # decoded during the scan (only matched paths are decoded)
+    fast_bytes_paths: bool = False
+
     # ------------------------------------------------------------------
     # Thumbnail generation
     # ------------------------------------------------------------------
@@ -63,34 +143,19 @@ class Config:
     thumb_suffix: str = "_thumb"
     thumb_folder_name: str = "thumbnails"
 
+    # Whether ffmpeg was found on this system (set by the GUI at startup)
+    ffmpeg_available: bool = False
+
     # ------------------------------------------------------------------
     # Metadata extraction
     # ------------------------------------------------------------------
 
     # Media categories to include during metadata processing
-    include_media_types: Dict[str, bool] = field(default_factory=lambda: {
-        "image": True,
-        "video": True,
-        "audio": True,
-        "other": True,
-    })
+    # Combination of MediaType flags, e.g. MediaType.IMAGE | MediaType.VIDEO
+    media_mask: int = MediaType.ALL
 
     # Metadata fields to extract and include in reports
-    metadata_fields: List[str] = field(default_factory=lambda: [
-        "file_path",
-        "file_size",
-        "media_type",
-        "extension",
-        "resolution_px",
-        "duration_seconds",
-        "sample_rate_hz",
-        "mode",
-        "format",
-        "frame_count",
-        "middle_frame_number",
-        "start_frame",
-        "end_frame",
-    ])
+    metadata_fields: tuple[str, ...] = METADATA_FIELDS
 
     # Metadata sorting options
     # Options: "file_path", "extension", "media_type"
@@ -111,7 +176,8 @@ class Config:
     # Filename-based organiser rules
     # Only used if organiser_mode == "string_rule"
     # Example rule: {"type": "contains", "value": "SEF"}
-    filename_rules: List[Dict] = field(default_factory=lambda: [])
+    # Any sequence of rule dicts is accepted (the GUI assigns a list)
+    filename_rules: tuple[dict, ...] = ()
 
     # Folder name for files that do not match organiser rules
     default_unsorted_folder: str = "unsorted"
@@ -131,7 +197,7 @@ class Config:
 
     # Output directory for reports
     # None = same folder as input
-    report_output_dir: Optional[str] = None
+    report_output_dir: str | None = None
 
     # ------------------------------------------------------------------
     # Logging and verbosity
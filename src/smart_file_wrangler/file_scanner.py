@@ -26,6 +26,8 @@ and hands them off to other subsystems.
 # Standard library imports
 # ----------------------------------------------------------------------
 
+import os
+from itertools import groupby
 from pathlib import Path
 
 # ----------------------------------------------------------------------
@@ -33,7 +35,7 @@ from pathlib import Path
 # ----------------------------------------------------------------------
 
 from .config import Config
-from .utils import detect_frame_sequences
+from .utils import detect_frame_sequences, file_extension, path_has_component
 from .media_item import MediaItem
 
 
@@ -56,21 +58,80 @@ def scan_folder(root_path, include_subfolders=None, file_types=None, ignore_thum
     Notes:
         - This function preserves legacy behavior and makes no assumptions about MediaItem.
         - No filtering is performed here.
+        - Always reads the disk; use FileScanner to reuse folder listings
+          across repeated scans.
+        - Symlinks: symlinked folders are never descended into (avoids
+          cycles); symlinks to files are returned like regular files;
+          broken symlinks are skipped. This matches the earlier
+          Path.rglob("*") + is_file() behavior.
+        - Entry types come from the directory listing (d_type), so regular
+          files and folders need no stat() call; only symlinks are stat'ed
+          to resolve their target type.
     """
+    return list(iter_scan_folder(
+        root_path,
+        include_subfolders=include_subfolders,
+        file_types=file_types,
+        ignore_thumbnails=ignore_thumbnails,
+        config=config,
+    ))
 
+
+def iter_scan_folder(root_path, include_subfolders=None, file_types=None, ignore_thumbnails=False, config=None):
+    """
+    Scan a folder and yield discovered files one at a time.
+
+    Same arguments and results as scan_folder(), without building the full
+    list, so huge trees can be processed with constant memory.
+
+    Returns:
+        Iterator[Path]: Matching files, produced lazily while walking.
+
+    Notes:
+        - The folder and arguments are validated when this is called, not
+          on first iteration, so errors surface at the call site.
+    """
+    return _scan_folder_validated(
+        _validated_folder(root_path),
+        include_subfolders, file_types, ignore_thumbnails, config,
+        list_directory=_list_directory,
+    )
+
+
+def _validated_folder(root_path):
+    """
+    Convert a scan root to Path and check that it is a folder.
+
+    Done once per public call; internal helpers receive the validated Path.
+    """
     root_path = Path(root_path)
 
-    # Validate input path early
     if not root_path.is_dir():
         raise ValueError(f"{root_path} is not a valid directory")
-    
+
+    return root_path
+
+
+def _scan_folder_validated(root_path, include_subfolders, file_types, ignore_thumbnails, config, list_directory):
+    """
+    Implementation of iter_scan_folder() for an already validated root
+    Path, with a pluggable folder lister (uncached for scan_folder(),
+    cached for FileScanner).
+
+    Returns a lazy iterator of Path objects; arguments are resolved and
+    checked before it is returned.
+    """
     # Resolve runtime configuration
     if config is not None:
         include_subfolders = config.recurse_subfolders
         ignore_thumbnails = config.ignore_thumbnail_folders
         thumb_folder_name = config.thumb_folder_name
+        scan_workers = config.scan_workers
+        bytes_paths = config.fast_bytes_paths and os.name == "posix"
     else:
         thumb_folder_name = None
+        scan_workers = 1
+        bytes_paths = False
 
     # Resolve recursion behavior
     # If not explicitly specified, fall back to global Defaults
@@ -79,44 +140,203 @@ def scan_folder(root_path, include_subfolders=None, file_types=None, ignore_thum
         "include_subfolders was not resolved from Config or arguments"
     )
 
-    # Normalize file extensions for comparison
-    # Convert to lowercase and strip leading dots
-    if file_types:
-        file_types = [ext.lower().lstrip(".") for ext in file_types]
+    root = os.fspath(root_path)
 
-    # Choose traversal method based on recursion setting
-    #
-    # rglob("*") walks all subdirectories recursively
-    # glob("*") only scans the top-level directory
-    if include_subfolders:
-        files_iterator = root_path.rglob("*")
-    else:
-        files_iterator = root_path.glob("*")
+    # Generated thumbnails are excluded so they are not reprocessed.
+    # Thumbnail folders are pruned while walking instead of checking every
+    # file's path; a root inside a thumbnail folder yields nothing.
+    skip_name = thumb_folder_name if ignore_thumbnails and thumb_folder_name else None
+    if path_has_component(root, skip_name):
+        return iter(())
 
-    matched_files = []
+    if bytes_paths:
+        return _scan_bytes(
+            root, include_subfolders, file_types, skip_name, scan_workers,
+            list_directory,
+        )
 
-    for file_path in files_iterator:
-        # Skip directories; only files are returned
-        if not file_path.is_file():
-            continue
+    # Walk with os.scandir on plain strings; Path objects are only
+    # created for the files that are returned
+    walk = _walk_files(
+        root, include_subfolders, scan_workers, list_directory, skip_name
+    )
 
-        # Optionally exclude thumbnail folders
-        #
-        # This check looks for the thumbnail folder name anywhere in the path
-        # parts to ensure generated thumbnails are not reprocessed.
-        if ignore_thumbnails and thumb_folder_name in file_path.parts:
-            continue
+    # One specialised loop per filter setup, so the per-file work is only
+    # what that setup needs. A file named like the thumbnail folder was
+    # also excluded by the previous per-path check; keep that behavior.
+    if file_types is None:
+        matched_files = (
+            Path(file_path) for file_path, file_name in walk
+            if file_name != skip_name
+        )
+    else:
+        wanted = _normalised_file_types(file_types)
 
-        # Check extension filter
-        #
-        # If file_types is None, all files are accepted.
-        # Otherwise, only files with matching extensions are included.
-        if file_types is None or file_path.suffix.lower().lstrip(".") in file_types:
-            matched_files.append(file_path)
+        matched_files = (
+            Path(file_path) for file_path, file_name in walk
+            if file_name != skip_name and file_extension(file_name) in wanted
+        )
 
     return matched_files
 
 
+def _scan_bytes(root, include_subfolders, file_types, skip_name, scan_workers, list_directory):
+    """
+    Bytes-path variant of the scan loop (POSIX only, Config.fast_bytes_paths).
+
+    os.scandir() on a bytes root returns bytes names and paths, so file
+    names are never decoded; only matched paths are decoded when they are
+    wrapped in Path.
+
+    Notes:
+        - Extension matching lowercases ASCII letters only; extensions
+          with non-ASCII capitals are matched case-sensitively.
+    """
+    skip_name = os.fsencode(skip_name) if skip_name is not None else None
+
+    walk = _walk_files(
+        os.fsencode(root), include_subfolders, scan_workers, list_directory, skip_name
+    )
+
+    if file_types is None:
+        return (
+            Path(os.fsdecode(file_path)) for file_path, file_name in walk
+            if file_name != skip_name
+        )
+
+    wanted = frozenset(map(os.fsencode, _normalised_file_types(file_types)))
+
+    return (
+        Path(os.fsdecode(file_path)) for file_path, file_name in walk
+        if file_name != skip_name and _bytes_extension(file_name) in wanted
+    )
+
+
+def _normalised_file_types(file_types):
+    """
+    Return file_types as a frozenset of lowercase extensions without dots.
+
+    Normalised here, once per scan, so the current value is always used
+    (Config is mutable and the GUI/CLI change file_types in place).
+    """
+    return frozenset(ext.lower().lstrip(".") for ext in file_types)
+
+
+def _bytes_extension(file_name):
+    """
+    Bytes counterpart of utils.file_extension() (same dot rules).
+    """
+    dot = file_name.rfind(b".")
+    if 0 < dot < len(file_name) - 1:
+        return file_name[dot + 1:].lower()
+    return b""
+
+
+def _walk_files(root, recursive, workers=1, list_directory=None, skip_folder=None):
+    """
+    Yield every file below a folder using os.scandir.
+
+    Args:
+        root (str): Folder to scan.
+        recursive (bool): Whether to descend into subfolders.
+        workers (int): Number of threads listing folders. 1 walks serially;
+            more lets slow or cold storage list several folders at once,
+            at the cost of a non-deterministic folder order.
+        list_directory (callable | None): Folder lister; defaults to
+            _list_directory().
+        skip_folder (str | None): Subfolder name that is never descended
+            into (the thumbnail folder).
+
+    Yields:
+        tuple[str, str]: (file path, file name) for each file. Both are
+        bytes when root is bytes. A serial walk is depth-first with files
+        before subfolders, in name order within each folder.
+
+    Notes:
+        - Matches the previous Path.rglob("*") / glob("*") + is_file()
+          results: symlinked folders are not descended into, symlinks to
+          files are included, and unreadable folders are skipped.
+        - DirEntry caches the entry type from the directory listing, so
+          most entries need no extra stat() call.
+    """
+    if list_directory is None:
+        list_directory = _list_directory
+
+    if recursive and workers > 1:
+        yield from _walk_files_parallel(root, workers, list_directory, skip_folder)
+        return
+
+    pending = [root]
+
+    while pending:
+        files, subfolders = list_directory(pending.pop())
+        yield from files
+        if recursive:
+            # Reversed so subfolders are popped (and yielded) in name order
+            pending.extend(
+                path for path, name in reversed(subfolders) if name != skip_folder
+            )
+
+
+def _walk_files_parallel(root, workers, list_directory, skip_folder):
+    """
+    Recursive variant of _walk_files() that lists folders on a thread pool.
+
+    Each finished listing immediately queues its subfolders, so up to
+    `workers` directory reads are in flight while files are yielded.
+    """
+    from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = {executor.submit(list_directory, root)}
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                files, subfolders = future.result()
+                for path, name in subfolders:
+                    if name != skip_folder:
+                        pending.add(executor.submit(list_directory, path))
+                yield from files
+
+
+def _list_directory(directory):
+    """
+    List one folder.
+
+    Returns:
+        tuple[list, list]: ([(file path, file name), ...],
+        [(subfolder path, subfolder name), ...]), each sorted by name.
+        Symlinked folders count as neither; an unreadable folder gives two
+        empty lists.
+
+    Notes:
+        - Sorting per folder (k log k for k entries) gives a stable scan
+          order without sorting the whole result, and keeps the frames of a
+          sequence adjacent and ascending for detect_frame_sequences().
+    """
+    files = []
+    subfolders = []
+
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subfolders.append((entry.path, entry.name))
+                    elif entry.is_file():
+                        files.append((entry.path, entry.name))
+                except OSError:
+                    continue
+    except OSError:
+        pass
+
+    files.sort()
+    subfolders.sort()
+    return files, subfolders
+
+
 def scan_files(folder_path, include_subfolders=None, file_types=None, combine_frame_seq=True, config=None):
     """
     Scan a folder and return files or grouped frame sequences.
@@ -156,18 +376,38 @@ def scan_files(folder_path, include_subfolders=None, file_types=None, combine_fr
         )
 
 
-    # First perform raw file discovery
-    files = scan_folder(folder_path, include_subfolders=include_subfolders, file_types=file_types, config=config)
+    # Raw file discovery (the folder is validated once here)
+    files = _scan_folder_validated(
+        _validated_folder(folder_path),
+        include_subfolders, file_types, False, config,
+        list_directory=_list_directory,
+    )
 
     # Optionally detect and group frame sequences
     #
     # When enabled, this replaces individual frame files with
     # structured sequence dictionaries.
     if combine_frame_seq:
-        items = detect_frame_sequences(files)
-    else:
-        items = files
+        return _detect_sequences_by_folder(files)
+
+    return list(files)
 
+
+def _detect_sequences_by_folder(files):
+    """
+    Group frame sequences folder by folder while the scan streams.
+
+    The walk yields each folder's files together and a sequence never
+    spans folders, so detect_frame_sequences() runs on one folder at a
+    time instead of on the complete file list after the scan.
+
+    Returns:
+        list[Path | dict]: Same items as detect_frame_sequences(files),
+        ordered folder by folder (sequences first within each folder).
+    """
+    items = []
+    for _, folder_files in groupby(files, key=os.path.dirname):
+        items.extend(detect_frame_sequences(folder_files))
     return items
 
 
@@ -176,19 +416,15 @@ def _items_to_media_items(items):
     Convert legacy scan output (Path | dict) into MediaItem objects.
     Behavior-safe: does not change scan logic, only wraps results.
     """
-    media_items = []
+    # Positional fields are (kind, path, sequence_info); the local binding
+    # avoids a global lookup per item
+    media_item = MediaItem
 
-    for item in items:
-        if isinstance(item, dict):
-            media_items.append(
-                MediaItem(kind="sequence", path=None, sequence_info=item)
-            )
-        else:
-            media_items.append(
-                MediaItem(kind="file", path=item, sequence_info=None)
-            )
-
-    return media_items
+    return [
+        media_item("sequence", None, item) if isinstance(item, dict)
+        else media_item("file", item, None)
+        for item in items
+    ]
 
 def scan_media_items(folder_path, include_subfolders=None, file_types=None, combine_frame_seq=True, config=None):
     """
@@ -214,6 +450,71 @@ def scan_media_items(folder_path, include_subfolders=None, file_types=None, comb
 
 
 
+class FileScanner:
+    """
+    Scanner that caches folder listings between scans.
+
+    Repeated scans of the same tree (for example a GUI re-running reports
+    with different filters) reuse the cached listings instead of reading
+    the disk again. The cache is never invalidated automatically: call
+    refresh() after files are added, moved or deleted (e.g. after the
+    organiser has run).
+
+    Usage:
+        scanner = FileScanner()
+        files = scanner.scan_folder(folder, config=config)
+    """
+
+    def __init__(self):
+        # folder path as scanned (str, or bytes for fast_bytes_paths)
+        # -> (files, subfolders) from _list_directory()
+        self._listings = {}
+        # same keys -> absolute str path, recorded when the folder is first
+        # listed, so refresh() matches however the root was spelled
+        self._absolute = {}
+
+    def scan_folder(self, root_path, include_subfolders=None, file_types=None, ignore_thumbnails=False, config=None):
+        """
+        Same as the module-level scan_folder(), using cached listings.
+        """
+        return list(_scan_folder_validated(
+            _validated_folder(root_path),
+            include_subfolders, file_types, ignore_thumbnails, config,
+            list_directory=self._list_directory,
+        ))
+
+    def refresh(self, folder=None):
+        """
+        Drop cached listings.
+
+        Args:
+            folder (str | Path | None): Only forget this folder and the
+                folders below it. None clears the whole cache. Relative
+                and absolute spellings are compared as absolute paths.
+        """
+        if folder is None:
+            self._listings.clear()
+            self._absolute.clear()
+            return
+
+        folder = os.path.abspath(os.fsdecode(folder))
+        prefix = folder.rstrip(os.sep) + os.sep
+
+        for cached_folder, absolute in list(self._absolute.items()):
+            if absolute == folder or absolute.startswith(prefix):
+                del self._listings[cached_folder]
+                del self._absolute[cached_folder]
+
+    def _list_directory(self, directory):
+        """Return the cached listing of a folder, reading it on first use."""
+        listing = self._listings.get(directory)
+        if listing is None:
+            listing = self._listings[directory] = _list_directory(directory)
+            # Keys are bytes for scans made with Config.fast_bytes_paths
+            self._absolute[directory] = os.path.abspath(os.fsdecode(directory))
+        return listing
+
+
 # ----------------------------------------------------------------------
 # Manual test harness
 # ----------------------------------------------------------------------
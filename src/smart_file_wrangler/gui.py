@@ -2,7 +2,8 @@
 gui.py
 
 This module provides the graphical interface for the Smart File Wrangler tool.
-The UI was built using Qt Designer (`main_window.ui`) and loaded at runtime.
+The UI was built using Qt Designer (`main_window.ui`), compiled to
+`ui_main_window.py` by build_ui.py, or loaded at runtime as a fallback.
 
 Responsibilities:
 - Let the user select a folder and organiser, thumbnail and report settings
@@ -19,23 +20,33 @@ Constraints:
 # Standard library imports
 # ----------------------------------------------------------------------
 import sys
-import subprocess
 import shutil
 import os
 import io
+import time
+from functools import lru_cache
 from pathlib import Path
 from contextlib import redirect_stdout, redirect_stderr
 
 from PySide6.QtWidgets import QWidget, QMainWindow, QFileDialog, QApplication
-from PySide6.QtUiTools import QUiLoader
-from PySide6.QtCore import QThread, Signal, QObject, QPoint, QTimer, QFile, QIODevice
+from PySide6.QtCore import Qt, QThread, Signal, QObject, QPoint, QTimer
+
+# QUiLoader (fallback UI loading) is imported inside _load_ui_file()
 
 # ----------------------------------------------------------------------
 # Local imports
 # ----------------------------------------------------------------------
 
 from smart_file_wrangler.config import Config
-from smart_file_wrangler.pipeline import run_pipeline
+
+# run_pipeline is imported inside PipelineWorker.run(), so the pipeline and
+# its media libraries load on the first run, not before the window opens
+
+# Generated by build_ui.py; absent in a plain checkout
+try:
+    from smart_file_wrangler.ui_main_window import Ui_MainWindow
+except ImportError:
+    Ui_MainWindow = None
 
 # -----------------------------
 # Build helper
@@ -51,105 +62,181 @@ def ui_resource_path(filename: str) -> Path:
         return Path(sys._MEIPASS) / "smart_file_wrangler" / filename
     return Path(__file__).resolve().parent / filename
 
+# -----------------------------
+# FFmpeg detection
+# -----------------------------
+# Common manual install locations, checked when ffmpeg is not on PATH
+_FFMPEG_MANUAL_LOCATIONS = (
+    "C:\\ffmpeg\\bin\\ffmpeg.exe",  # Windows manual install
+    "C:\\Program Files\\ffmpeg\\bin\\ffmpeg.exe",
+    "C:\\Program Files (x86)\\ffmpeg\\bin\\ffmpeg.exe",
+    "/Applications/ffmpeg",  # mac manual
+    "/usr/local/bin/ffmpeg",  # mac brew intel/manual
+)
+
+
+@lru_cache(maxsize=1)
+def find_ffmpeg():
+    """
+    Locate an executable ffmpeg without launching it.
+
+    Returns:
+        str | None: Path to ffmpeg, or None if it was not found.
+
+    Notes:
+        - Only searches PATH and the manual install locations; no process
+          is spawned, so window startup is not delayed.
+        - Cached for the process; call find_ffmpeg.cache_clear() after
+          installing ffmpeg to detect it again.
+    """
+    ffmpeg_path = shutil.which("ffmpeg")
+    if ffmpeg_path:
+        return ffmpeg_path
+
+    for path in _FFMPEG_MANUAL_LOCATIONS:
+        if os.path.isfile(path) and os.access(path, os.X_OK):
+            return path
+
+    return None
+
+
 # -----------------------------
 # Worker to run pipeline off the UI thread
 # -----------------------------
+class _SignalStream(io.TextIOBase):
+    """
+    Line-buffered text stream that emits each completed line via a signal.
+
+    Used as the stdout/stderr target while the pipeline runs, so output
+    reaches the log box as it happens instead of in one block at the end.
+    """
+
+    def __init__(self, signal):
+        super().__init__()
+        self._signal = signal
+        self._buf = []
+
+    def writable(self):
+        return True
+
+    def write(self, text):
+        if "\n" not in text:
+            self._buf.append(text)
+            return len(text)
+
+        *lines, rest = text.split("\n")
+        lines[0] = "".join(self._buf) + lines[0]
+        for line in lines:
+            self._signal.emit(line)
+
+        self._buf = [rest] if rest else []
+        return len(text)
+
+    def flush(self):
+        if self._buf:
+            line = "".join(self._buf)
+            self._buf = []
+            self._signal.emit(line)
+
+
 class PipelineWorker(QObject):
     output = Signal(str)
+    progress = Signal(int, int)  # done, total
     finished = Signal()
     failed = Signal(str)
 
+    # Minimum seconds between progress signals within a stage
+    PROGRESS_INTERVAL = 0.05
+
     def __init__(self, folder: str, config: Config):
         super().__init__()
         self.folder = folder
         self.config = config
+        self._last_progress = 0.0
+
+    def _report_progress(self, done: int, total: int):
+        # Called per item by the pipeline; emit the start and end of each
+        # stage and at most one update per interval in between, so large
+        # trees do not flood the UI event loop with queued signals
+        now = time.monotonic()
+        if done == 0 or done >= total or now - self._last_progress >= self.PROGRESS_INTERVAL:
+            self._last_progress = now
+            self.progress.emit(done, total)
 
     def run(self):
+        stream = _SignalStream(self.output)
         try:
-            buf = io.StringIO()
-            # Capture anything printed/logged to stdout/stderr during the run
-            with redirect_stdout(buf), redirect_stderr(buf):
-                run_pipeline(self.folder, self.config)
+            # Imported here so a missing media library is reported as a failure
+            from smart_file_wrangler.pipeline import run_pipeline
 
-            text = buf.getvalue().strip()
-            if text:
-                self.output.emit(text)
+            # Stream anything printed/logged to stdout/stderr during the run
+            with redirect_stdout(stream), redirect_stderr(stream):
+                try:
+                    run_pipeline(self.folder, self.config, progress_cb=self._report_progress)
+                finally:
+                    stream.flush()
 
             self.finished.emit()
         except Exception as e:
             self.failed.emit(str(e))
 
 
+# Organise mode dropdown text -> Config.organiser_mode (stored on the combo
+# items as user data at startup)
+_MODE_MAP = {
+    "media type": "media_type",
+    "file extension": "extension",
+    "name rule": "string_rule",
+}
+
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
 
         self.config = Config()
         self.folder = None
-        import shutil
-        import os
-        import subprocess
-
-        # Check for ffmpeg
-        ffmpeg_path = shutil.which("ffmpeg")
-
-        if not ffmpeg_path:
-            # Common manual install locations
-            manual_locations = [
-                "C:\\ffmpeg\\bin\\ffmpeg.exe",  # Windows manual install
-                "C:\\Program Files\\ffmpeg\\bin\\ffmpeg.exe",
-                "C:\\Program Files (x86)\\ffmpeg\\bin\\ffmpeg.exe",
-                "/Applications/ffmpeg",  # mac manual
-                "/usr/local/bin/ffmpeg",  # mac brew intel/manual
-            ]
-
-            for path in manual_locations:
-                if os.path.isfile(path) and os.access(path, os.X_OK):
-                    ffmpeg_path = path
-                    break
-
-        # Verify ffmpeg runs
-        if ffmpeg_path:
-            try:
-                subprocess.run([ffmpeg_path, "-version"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
-                               check=True)
-                self.config.ffmpeg_available = True
-            except Exception:
-                self.config.ffmpeg_available = False
-        else:
-            self.config.ffmpeg_available = False
-
-        # Load UI
-        loader = QUiLoader()
 
-        ui_path = ui_resource_path("main_window.ui")
-        ui_file = QFile(str(ui_path))
+        # Check for ffmpeg (PATH / known locations only, no subprocess)
+        self.config.ffmpeg_available = find_ffmpeg() is not None
 
-        if not ui_file.open(QIODevice.ReadOnly):
-            raise RuntimeError(f"Unable to open/read ui device: {ui_path}")
+        # Load UI: precompiled module (see build_ui.py) when available,
+        # otherwise parse main_window.ui at runtime
+        if Ui_MainWindow is not None:
+            self.ui = Ui_MainWindow()
+            self.ui.setupUi(self)
+        else:
+            self.ui = self._load_ui_file()
+            self.setCentralWidget(self.ui)
 
-        self.ui = loader.load(ui_file)
-        ui_file.close()
+        self.ui.log_box.setMinimumHeight(120)
 
-        if self.ui is None:
-            raise RuntimeError(f"Failed to load UI file: {ui_path}")
+        # Bounded, undo-free log: the oldest lines drop off past the cap
+        self.ui.log_box.setMaximumBlockCount(5000)
+        self.ui.log_box.setUndoRedoEnabled(False)
 
-        self.setCentralWidget(self.ui)
-        self.ui.log_box.setMinimumHeight(120)
+        # Pipeline output is buffered and written to the log box at most
+        # every 50 ms, one block per flush instead of one layout per line
+        self._log_buffer: list[str] = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(50)
+        self._log_timer.timeout.connect(self._flush_log)
 
         #self.debug_tree()
 
+        self._tag_mode_combo()
+
         # Wire signals
         self.ui.select_folder_btn.clicked.connect(self.pick_folder)
         self.ui.run_btn.clicked.connect(self.on_run_clicked)
-        self.ui.organise_mode_combo.currentTextChanged.connect(self.on_mode_changed)
+        self.ui.organise_mode_combo.currentIndexChanged.connect(self.on_mode_changed)
         self.ui.expand_log_check.toggled.connect(self.on_toggle_log)
 
         # Initial UI state
         self.ui.ffmpeg_btn.clicked.connect(self.install_ffmpeg)
         self.apply_ffmpeg_status()
-        self.on_mode_changed(self.ui.organise_mode_combo.currentText())
-        self.on_toggle_log(self.ui.expand_log_check.isChecked())
+        self.on_mode_changed(self.ui.organise_mode_combo.currentIndex())
 
         # Progress bar initial (not running)
         self.ui.progressBar.setRange(0, 1)
@@ -159,17 +246,32 @@ class MainWindow(QMainWindow):
         self._thread = None
         self._worker = None
 
-        self.show()
-        self.on_toggle_log(self.ui.expand_log_check.isChecked())
-        QTimer.singleShot(0, lambda: self._resize_to_widget_bottom(self.ui.progressBar))
+        # Shown by the caller (launch_gui); the initial log state and window
+        # size are applied once, in showEvent
+        self._first_show_done = False
 
+    def showEvent(self, event):
+        super().showEvent(event)
 
+        # Apply the log panel state once the real layout exists; this
+        # schedules the single startup resize (expanded log or fit to the
+        # progress bar)
+        if not self._first_show_done:
+            self._first_show_done = True
+            self.on_toggle_log(self.ui.expand_log_check.isChecked())
 
     def _resize_to_widget_bottom(self, widget, padding=24):
         # bottom-left of widget in MainWindow coordinate space
         bottom_left = widget.mapTo(self, QPoint(0, widget.height()))
         self.resize(self.width(), bottom_left.y() + padding)
 
+    # Deferred resize targets for QTimer.singleShot (bound methods, no closures)
+    def _resize_to_progress(self):
+        self._resize_to_widget_bottom(self.ui.progressBar)
+
+    def _resize_to_expanded_log(self):
+        self.resize(self.width(), 800)
+
 
 
     # -----------------------------
@@ -187,9 +289,16 @@ class MainWindow(QMainWindow):
             self.ui.ffmpeg_btn.setEnabled(True)
             self.ui.ffmpeg_btn.setVisible(True)
 
-    def on_mode_changed(self, text: str):
-        # Combo items are: "media type", "file extension", "name rule"
-        is_name_rule = text.strip().lower() == "name rule"
+    def _tag_mode_combo(self):
+        # Attach each item's backend tag once, so mode checks read the tag
+        # instead of normalising and comparing the label text
+        combo = self.ui.organise_mode_combo
+        for index in range(combo.count()):
+            combo.setItemData(index, _MODE_MAP.get(combo.itemText(index).strip().lower()))
+
+    def on_mode_changed(self, index: int):
+        # Items carry their organiser_mode tag as user data (_tag_mode_combo)
+        is_name_rule = self.ui.organise_mode_combo.itemData(index) == "string_rule"
         self.ui.organise_string_combo.setVisible(is_name_rule)
         self.ui.organise_string_lineedit.setVisible(is_name_rule)
 
@@ -200,21 +309,63 @@ class MainWindow(QMainWindow):
             self.ui.log_widget.setVisible(True)
             self.ui.log_widget.setFixedHeight(240)  # was setMaximumHeight(240)
             #QTimer.singleShot(0, lambda: self._resize_to_widget_bottom(self.ui.log_widget))
-            QTimer.singleShot(0, lambda: self.resize(self.width(), 800))
+            QTimer.singleShot(0, self._resize_to_expanded_log)
             self.ui.log_widget.raise_()
 
         else:
             self.ui.log_widget.setFixedHeight(0)    # was setMaximumHeight(0)
             self.ui.log_widget.setVisible(False)
-            QTimer.singleShot(0, lambda: self._resize_to_widget_bottom(self.ui.progressBar))
+            QTimer.singleShot(0, self._resize_to_progress)
+
+    def _load_ui_file(self):
+        """
+        Fallback UI loading via QUiLoader, used when ui_main_window.py
+        has not been generated.
+        """
+        from PySide6.QtUiTools import QUiLoader
+        from PySide6.QtCore import QFile, QIODevice
+
+        loader = QUiLoader()
+
+        ui_path = ui_resource_path("main_window.ui")
+        ui_file = QFile(str(ui_path))
+
+        if not ui_file.open(QIODevice.ReadOnly):
+            raise RuntimeError(f"Unable to open/read ui device: {ui_path}")
+
+        ui = loader.load(ui_file)
+        ui_file.close()
+
+        if ui is None:
+            raise RuntimeError(f"Failed to load UI file: {ui_path}")
+
+        return ui
+
+    def debug_tree(self, widget=None):
+        """
+        Print the widget hierarchy (diagnostics only, enabled by setting the
+        SFW_DEBUG_TREE environment variable).
+        """
+        if not os.environ.get("SFW_DEBUG_TREE"):
+            return
 
-    def debug_tree(self, widget=None, indent=0):
         if widget is None:
-            widget = self.ui
-        print("  " * indent + f"- {widget.objectName()} ({type(widget).__name__})")
-        for child in widget.children():
-            if isinstance(child, QWidget):
-                self.debug_tree(child, indent + 1)
+            widget = self.centralWidget()
+
+        # Explicit stack instead of recursion; children pushed in reverse
+        # so the output keeps the depth-first child order
+        lines = []
+        stack = [(widget, 0)]
+        while stack:
+            current, indent = stack.pop()
+            lines.append("  " * indent + f"- {current.objectName()} ({type(current).__name__})")
+            stack.extend(
+                (child, indent + 1)
+                for child in reversed(current.children())
+                if isinstance(child, QWidget)
+            )
+
+        print("\n".join(lines))
 
 
 
@@ -249,68 +400,69 @@ class MainWindow(QMainWindow):
             # expand log and disable Run button to force restart after install
             self.ui.expand_log_check.setChecked(True)
             self.ui.run_btn.setEnabled(False)  # Run stays disabled until restart
-            self.ui.log_box.append(f"FFmpeg installed successfully on {system}. Please restart the app to continue.")
+            self.ui.log_box.appendPlainText(f"FFmpeg installed successfully on {system}. Please restart the app to continue.")
 
         except Exception:
             webbrowser.open("https://ffmpeg.org/download.html")
             self.ui.expand_log_check.setChecked(True)
-            self.ui.log_box.append("Please install FFmpeg manually, then restart the app.")
+            self.ui.log_box.appendPlainText("Please install FFmpeg manually, then restart the app.")
+
+        # Forget the cached "not found" results so the next check looks again
+        from smart_file_wrangler.utils import is_ffmpeg_available
+
+        find_ffmpeg.cache_clear()
+        is_ffmpeg_available.cache_clear()
 
 
     # -----------------------------
     # Config wiring (UI -> Config)
     # -----------------------------
     def read_ui_into_config(self):
+        ui = self.ui
         c = self.config
 
         # scanning
-        c.recurse_subfolders = self.ui.recurse_subfolders_check.isChecked()
+        c.recurse_subfolders = ui.recurse_subfolders_check.isChecked()
 
         # logging
-        c.expand_log = self.ui.expand_log_check.isChecked()
-        c.verbose = self.ui.log_verbose_check.isChecked()
+        c.expand_log = ui.expand_log_check.isChecked()
+        c.verbose = ui.log_verbose_check.isChecked()
 
         # organiser
-        c.enable_organiser = self.ui.organise_enable_check.isChecked()
+        c.enable_organiser = ui.organise_enable_check.isChecked()
         
-        # map dropdown text to backend organiser_mode
-        mode = self.ui.organise_mode_combo.currentText().strip().lower()
-        if mode == "media type":
-            c.organiser_mode = "media_type"
-        elif mode == "file extension":
-            c.organiser_mode = "extension"
-        elif mode == "name rule":
-            c.organiser_mode = "string_rule"
+        # backend organiser_mode tag stored on the selected item
+        c.organiser_mode = ui.organise_mode_combo.currentData() or c.organiser_mode
 
         # Capture rule string from UI when in string_rule mode
         if c.organiser_mode == "string_rule":
-            rule_text = self.ui.organise_string_lineedit.text().strip().lower()
+            rule_text = ui.organise_string_lineedit.text().strip().lower()
             if rule_text:
-                c.filename_rules = [{"type": self.ui.organise_string_combo.currentText().strip().lower(), "value": rule_text}]
+                c.filename_rules = [{"type": ui.organise_string_combo.currentText().strip().lower(), "value": rule_text}]
             else:
                 c.filename_rules = []  
 
-        c.move_files = self.ui.organise_move_radio.isChecked()
+        c.move_files = ui.organise_move_radio.isChecked()
 
         # thumbnails
-        c.generate_thumbnails = self.ui.thumbnails_enable_check.isChecked()
-        c.thumb_images = self.ui.thumbnails_images_check.isChecked()
-        c.thumb_videos = self.ui.thumbnails_videos_check.isChecked()
-        c.thumb_suffix = self.ui.thumbnails_suffix_lineedit.text().strip() or c.thumb_suffix
+        c.generate_thumbnails = ui.thumbnails_enable_check.isChecked()
+        c.thumb_images = ui.thumbnails_images_check.isChecked()
+        c.thumb_videos = ui.thumbnails_videos_check.isChecked()
+        c.thumb_suffix = ui.thumbnails_suffix_lineedit.text().strip() or c.thumb_suffix
 
         # thumb size from combo (strings like "512")
         try:
-            c.thumb_size = int(self.ui.thumbnails_size_combo.currentText())
+            c.thumb_size = int(ui.thumbnails_size_combo.currentText())
         except ValueError:
             pass  # keep existing default
 
         # reports
-        reports_enabled = self.ui.reports_enable_check.isChecked()
+        reports_enabled = ui.reports_enable_check.isChecked()
         if reports_enabled:
-            c.output_csv = self.ui.reports_csv_check.isChecked()
-            c.output_json = self.ui.reports_json_check.isChecked()
-            c.output_excel = self.ui.reports_excel_check.isChecked()
-            c.output_tree = self.ui.reports_tree_check.isChecked()
+            c.output_csv = ui.reports_csv_check.isChecked()
+            c.output_json = ui.reports_json_check.isChecked()
+            c.output_excel = ui.reports_excel_check.isChecked()
+            c.output_tree = ui.reports_tree_check.isChecked()
         else:
             c.output_csv = False
             c.output_json = False
@@ -322,7 +474,7 @@ class MainWindow(QMainWindow):
     # -----------------------------
     def on_run_clicked(self):
         if not self.folder:
-            self.ui.log_box.append("No folder selected!")
+            self.ui.log_box.appendPlainText("No folder selected!")
             return
 
         # Update Config from UI
@@ -331,8 +483,9 @@ class MainWindow(QMainWindow):
         # Clear log for new run
         self.ui.log_box.clear()
 
-        # Start progress animation
-        self.ui.progressBar.setRange(0, 0)  # indeterminate/spinning
+        # Reset progress; the range is set by the first progress signal
+        self.ui.progressBar.setRange(0, 1)
+        self.ui.progressBar.setValue(0)
 
         # Disable run button while running
         self.ui.run_btn.setEnabled(False)
@@ -343,7 +496,10 @@ class MainWindow(QMainWindow):
         self._worker.moveToThread(self._thread)
 
         self._thread.started.connect(self._worker.run)
-        self._worker.output.connect(self.append_log)
+        # Worker signals fire on the worker thread; widgets may only be
+        # touched on the UI thread, so these are always queued
+        self._worker.output.connect(self.append_log, Qt.QueuedConnection)
+        self._worker.progress.connect(self.on_progress, Qt.QueuedConnection)
         self._worker.failed.connect(self.on_failed)
         self._worker.finished.connect(self.on_finished)
 
@@ -356,15 +512,33 @@ class MainWindow(QMainWindow):
         self._thread.start()
 
     def append_log(self, text: str):
-        # Preserve formatting
-        self.ui.log_box.append(text)
+        self._log_buffer.append(text)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _flush_log(self):
+        self._log_timer.stop()
+        if self._log_buffer:
+            self.ui.log_box.appendPlainText("\n".join(self._log_buffer))
+            self._log_buffer.clear()
+
+    def on_progress(self, done: int, total: int):
+        # Each pipeline stage reports its own total; an empty stage keeps
+        # the bar determinate instead of switching to the busy animation
+        total = max(total, 1)
+        if self.ui.progressBar.maximum() != total:
+            self.ui.progressBar.setRange(0, total)
+        self.ui.progressBar.setValue(done)
 
     def on_failed(self, msg: str):
-        self.ui.log_box.append(f"ERROR: {msg}")
+        self._flush_log()
+        self.ui.log_box.appendPlainText(f"ERROR: {msg}")
         self.on_finished()
 
     def on_finished(self):
-        # Stop progress animation
+        self._flush_log()
+
+        # Show the bar as complete
         self.ui.progressBar.setRange(0, 1)
         self.ui.progressBar.setValue(1)
         self.ui.run_btn.setEnabled(True)
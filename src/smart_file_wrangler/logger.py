@@ -17,8 +17,12 @@ Responsibilities:
 # Standard library imports
 # ----------------------------------------------------------------------
 
+import atexit
+import queue
+import sys
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TextIO
 
 # ----------------------------------------------------------------------
 # Log level labels (enum-like, for consistency)
@@ -29,12 +33,37 @@ class LogLevel:
     ERROR = "error"
     DEBUG = "debug"
 
+# Line prefixes for the known labels, built once; other labels are
+# formatted on use. Callers pass both "info" (LogLevel.INFO) and "INFO",
+# so both spellings are keys.
+_PREFIX = {}
+for _level in (LogLevel.INFO, LogLevel.WARNING, LogLevel.ERROR, LogLevel.DEBUG):
+    _PREFIX[_level] = _PREFIX[_level.upper()] = f"[{_level.upper()}] "
+del _level
+
+
+def _format_line(message: str, level: str, args: tuple = ()) -> str:
+    # %-style arguments are applied here, only once a sink will use the line
+    if args:
+        message = message % args
+    prefix = _PREFIX.get(level)
+    if prefix is None:
+        prefix = f"[{level.upper()}] "
+    return prefix + message
+
 # ----------------------------------------------------------------------
 # Internal singleton logger + central verbosity + optional file sink
 # ----------------------------------------------------------------------
 _logger: Optional["Logger"] = None
 _verbose: bool = False
 _file_sink: Optional[str] = None  # file sink path (string form)
+_file_queue: Optional[queue.Queue] = None  # accepts lines; None when no sink or after a write error
+_file_writer_state: Optional[tuple[threading.Thread, queue.Queue, TextIO]] = None
+_file_dropped: int = 0  # lines dropped because the writer fell 10000 lines behind
+
+# Seconds to wait for the writer to drain when a sink is closed (incl. at exit)
+_FILE_CLOSE_TIMEOUT = 2.0
+_any_sink_active: bool = False  # fast path for log(); see _update_sink_state()
 
 # ----------------------------------------------------------------------
 # Logger class
@@ -47,26 +76,39 @@ class Logger:
         """
         self.ui_callback = ui_callback
 
-    def log(self, message: str, level: str = LogLevel.INFO):
+    def log(self, message: str, *args, level: str = LogLevel.INFO):
         """
         Log a message with a severity label.
 
         Parameters:
-            message (str): The log message.
+            message (str): The log message, optionally with %-style placeholders.
+            *args: Values for the placeholders, formatted only if a sink is active.
             level (str): One of LogLevel.* labels. Does not filter or change behavior.
         """
+        # Nothing to format when every sink is off
+        if not _verbose and not self.ui_callback and _file_queue is None:
+            return
+
+        line = _format_line(message, level, args)
+
         # Terminal sink (legacy behavior preserved, controlled centrally by _verbose)
         if _verbose:
-            print(f"[{level.upper()}] {message}")
+            print(line)
 
         # UI sink if provided
         if self.ui_callback:
-            self.ui_callback(f"[{level.upper()}] {message}")
+            self.ui_callback(line)
 
-        # Optional file sink (non-print sink)
-        if _file_sink:
-            with open(_file_sink, "a", encoding="utf-8") as f:
-                f.write(f"[{level.upper()}] {message}\n")
+        # Optional file sink (non-print sink), written by a background thread
+        # so a slow disk never stalls the caller (e.g. the UI thread).
+        # Read the global once: another thread may close the sink meanwhile.
+        file_queue = _file_queue
+        if file_queue is not None:
+            try:
+                file_queue.put_nowait(line + "\n")
+            except queue.Full:
+                global _file_dropped
+                _file_dropped += 1
 
 # ----------------------------------------------------------------------
 # Public initializer (call once from an entry point, sets central flags)
@@ -82,6 +124,7 @@ def init_logger(verbose: bool = False, ui_callback=None):
     global _logger, _verbose
     _verbose = verbose  # central verbosity control
     _logger = Logger(ui_callback)
+    _update_sink_state()
 
 # ----------------------------------------------------------------------
 # Optional: set a file sink path (safe to call once, no other modules touched)
@@ -90,25 +133,130 @@ def set_file_sink(path: Path | str):
     """
     Set a file path to receive log messages.
 
+    The file is opened once in append mode. log() only queues lines; a
+    background thread writes them, batching whatever has queued up into
+    one write and flushing when the queue is drained.
+
+    log() never blocks on the file: if 10000 lines are already waiting,
+    the line is dropped and counted (reported when the sink is closed).
+    If a write fails (disk full, drive disconnected), the error is printed
+    to stderr and the file sink is disabled. Any previous sink is closed;
+    the open sink is drained and closed at exit, waiting at most a couple
+    of seconds for the writer.
+
     Parameters:
         path (Path | str): Filesystem path to a log file.
     """
-    global _file_sink
+    global _file_sink, _file_queue, _file_writer_state, _file_dropped
+    _close_file_sink()
     _file_sink = str(path)
+    handle = open(_file_sink, "a", encoding="utf-8")
+    file_queue = queue.Queue(maxsize=10000)
+    thread = threading.Thread(
+        target=_run_file_writer,
+        args=(file_queue, handle),
+        name="sfw-log-writer",
+        daemon=True,
+    )
+    _file_dropped = 0
+    _file_writer_state = (thread, file_queue, handle)
+    _file_queue = file_queue
+    thread.start()
+    _update_sink_state()
+
+
+def _run_file_writer(file_queue, handle):
+    """Writer thread: drain queued lines to the sink file until None arrives."""
+    while True:
+        line = file_queue.get()
+        batch = []
+        while line is not None:
+            batch.append(line)
+            try:
+                line = file_queue.get_nowait()
+            except queue.Empty:
+                break
+
+        if batch:
+            try:
+                handle.write("".join(batch))
+                handle.flush()
+            except (OSError, ValueError) as error:
+                _disable_file_sink(file_queue, error)
+                return
+
+        if line is None:
+            return
+
+
+def _disable_file_sink(file_queue, error):
+    """Stop queueing lines for a sink whose writer hit a write error."""
+    global _file_queue
+    if _file_queue is file_queue:
+        _file_queue = None
+        _update_sink_state()
+
+    try:
+        print(f"[ERROR] Log file sink disabled ({_file_sink}): {error}", file=sys.stderr)
+    except Exception:
+        pass  # no usable stderr (e.g. windowed build)
+
+
+@atexit.register
+def _close_file_sink():
+    global _file_queue, _file_writer_state
+    if _file_writer_state is None:
+        return
+
+    # Stop accepting lines, let the writer drain the queue, then close
+    thread, file_queue, handle = _file_writer_state
+    _file_writer_state = None
+    _file_queue = None
+    _update_sink_state()
+
+    if thread.is_alive():
+        try:
+            file_queue.put(None, timeout=_FILE_CLOSE_TIMEOUT)
+        except queue.Full:
+            pass
+        thread.join(timeout=_FILE_CLOSE_TIMEOUT)
+
+    # A writer stuck on a dead drive keeps the handle; it is a daemon
+    # thread, so it cannot hold up interpreter exit
+    if thread.is_alive():
+        return
+
+    try:
+        if _file_dropped:
+            handle.write(f"[WARNING] {_file_dropped} log lines dropped (file sink fell behind)\n")
+        handle.close()
+    except (OSError, ValueError):
+        pass
+
+
+def _update_sink_state():
+    """Recompute whether an initialized logger has any sink to write to."""
+    global _any_sink_active
+    _any_sink_active = _logger is not None and bool(
+        _verbose or _logger.ui_callback or _file_queue is not None
+    )
 
 # ----------------------------------------------------------------------
 # Global log wrapper (safe to call anywhere, preserves legacy fallback)
 # ----------------------------------------------------------------------
-def log(message: str, *, level: str = LogLevel.INFO):
+def log(message: str, *args, level: str = LogLevel.INFO):
     """
     Log a message via the global logger, preserving legacy print fallback.
 
     Parameters:
-        message (str): Log message.
+        message (str): Log message, optionally with %-style placeholders,
+            e.g. log("found %d files", count).
+        *args: Values for the placeholders. Formatting is skipped entirely
+            when the initialized logger has no active sink.
         level (str): Severity label (LogLevel.*). For labeling only.
     """
-    if _logger:
-        _logger.log(message, level=level)
-    else:
+    if _any_sink_active:
+        _logger.log(message, *args, level=level)
+    elif _logger is None:
         # Legacy fallback terminal sink (behavior preserved)
-        print(f"[{level.upper()}] {message}")
+        print(_format_line(message, level, args))
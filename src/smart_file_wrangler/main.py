@@ -9,20 +9,23 @@ Determines whether to run CLI or GUI, and manages modular workflows:
 - Thumbnails only
 """
 
-from smart_file_wrangler import cli, gui
 import sys
 
 def main():
     """
     If CLI arguments are provided, run the terminal workflow.
     Otherwise, start the PySide GUI application.
+
+    Only the chosen front end is imported, so CLI runs never load PySide6.
     """
     if len(sys.argv) > 1:
         # CLI mode
+        from smart_file_wrangler import cli
         cli.run_cli()
     else:
         # GUI mode
-        gui.run_gui()
+        from smart_file_wrangler import gui
+        gui.launch_gui()
 
 if __name__ == "__main__":
     main()
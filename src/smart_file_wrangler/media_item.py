@@ -25,7 +25,7 @@ from typing import Literal
 # ----------------------------------------------------------------------
 # Dataclass
 # ----------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class MediaItem:
     """
     A simple container representing one discovered media item.
@@ -43,6 +43,10 @@ class MediaItem:
             - Stores sequence metadata if `kind == "sequence"`
             - Must be `None` if `kind == "file"`
 
+    Notes:
+        - `slots=True` drops the per-instance `__dict__`; one MediaItem is
+          created per scanned file, so this keeps large scans lean.
+
     Example:
         MediaItem(kind="file", path=Path("/tmp/video.mp4"))
         MediaItem(kind="sequence", sequence_info={"start": 1001, "end": 1050})
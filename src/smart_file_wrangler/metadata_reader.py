@@ -30,9 +30,9 @@ from PIL import Image
 # ----------------------------------------------------------------------
 # Local imports
 # ----------------------------------------------------------------------
-from .utils import (is_ffmpeg_available, image_extensions, video_extensions, audio_extensions)
+from .utils import is_ffmpeg_available, EXT_MEDIA_LUT
 from .file_scanner import scan_folder
-from .config import Config
+from .config import Config, MEDIA_TYPE_FLAGS
 from .media_item import MediaItem
 
 
@@ -196,12 +196,13 @@ def extract_metadata(file_path):
 
     file_size_bytes = file_path.stat().st_size
     extension = file_path.suffix.lower()
+    media_type = EXT_MEDIA_LUT.get(extension, "other")
 
     # Base metadata shared by all file types
     metadata = {
         "file_path": str(file_path),
         "file_size_bytes": file_size_bytes,
-        "media_type": "other",
+        "media_type": media_type,
         "extension": extension,
         "resolution_px": None,
         "duration_seconds": None,
@@ -213,8 +214,7 @@ def extract_metadata(file_path):
     # ------------------------------------------------------------------
     # IMAGE FILES
     # ------------------------------------------------------------------
-    if extension in image_extensions:
-        metadata["media_type"] = "image"
+    if media_type == "image":
         try:
             with Image.open(file_path) as image:
                 metadata["resolution_px"] = f"{image.width}x{image.height}"
@@ -227,16 +227,14 @@ def extract_metadata(file_path):
     # ------------------------------------------------------------------
     # VIDEO FILES
     # ------------------------------------------------------------------
-    elif extension in video_extensions:
-        metadata["media_type"] = "video"
+    elif media_type == "video":
         if is_ffmpeg_available():
             _populate_ffprobe_metadata(file_path, metadata)
 
     # ------------------------------------------------------------------
     # AUDIO FILES
     # ------------------------------------------------------------------
-    elif extension in audio_extensions:
-        metadata["media_type"] = "audio"
+    elif media_type == "audio":
         if is_ffmpeg_available():
             _populate_ffprobe_metadata(file_path, metadata)
 
@@ -271,11 +269,7 @@ def extract_metadata_for_folder(folder_path, config=None):
             "Pipeline must pass config explicitly."
         )
 
-    folder_path = Path(folder_path)
-
-    if not folder_path.is_dir():
-        raise ValueError(f"{folder_path} is not a valid directory")
-
+    # scan_folder() validates the folder (same ValueError as before)
     files = scan_folder(
         folder_path,
         include_subfolders=config.recurse_subfolders,
@@ -284,19 +278,20 @@ def extract_metadata_for_folder(folder_path, config=None):
     )
 
     all_file_metadata = []
+    wanted_fields = frozenset(config.metadata_fields)
 
     for current_file in files:
         file_metadata = extract_metadata(current_file)
 
-        media_type = file_metadata["media_type"]
-        if not config.include_media_types.get(media_type, False):
+        media_flag = MEDIA_TYPE_FLAGS.get(file_metadata["media_type"], 0)
+        if not config.media_mask & media_flag:
             continue
 
 
         # Filter metadata fields based on user configuration
         filtered_metadata = {}
         for key, value in file_metadata.items():
-            if key in config.metadata_fields:
+            if key in wanted_fields:
                 filtered_metadata[key] = value
 
 
@@ -310,7 +305,7 @@ def extract_metadata_for_folder(folder_path, config=None):
 # ----------------------------------------------------------------------
 
 if __name__ == "__main__":
-    from .config import Config
+    from .config import Config, MediaType
     from .utils import group_frame_sequences
     from .file_scanner import scan_folder
     from .thumbnailer import generate_thumbnail_for_sequence  # only used in sequence test print
@@ -339,7 +334,7 @@ if __name__ == "__main__":
         thumb_size=(400, 300),
         thumb_suffix="_thumb",
         thumb_folder_name="thumbnails",
-        include_media_types={"image": True, "video": True, "audio": True, "other": True},
+        media_mask=MediaType.ALL,
         metadata_fields=["file_path", "file_size_bytes", "media_type", "extension", "resolution_px", "duration_seconds", "sample_rate_hz", "mode", "format"],
         metadata_sort_by="file_size_bytes",
         metadata_sort_reverse=False,
@@ -21,6 +21,8 @@ Responsibilities:
 # Standard library imports
 # ----------------------------------------------------------------------
 
+import os
+import re
 from pathlib import Path
 from shutil import copy2, move
 
@@ -29,9 +31,8 @@ from shutil import copy2, move
 # ----------------------------------------------------------------------
 
 from .file_scanner import scan_folder
-from .metadata_reader import extract_metadata
 from .config import Config
-from .utils import group_frame_sequences
+from .utils import group_frame_sequences, file_extension, path_has_component, EXT_MEDIA_LUT
 from .media_item import MediaItem
 
 
@@ -122,6 +123,9 @@ def organise_files(
 
     # do nothing here — already grouped earlier in legacy_items
 
+    # Normalise and compile string rules once for the whole run
+    string_rules = _compile_string_rules(rules) if mode == "string_rule" else None
+
     created_folders = set()
     processed_files = 0
 
@@ -143,27 +147,17 @@ def organise_files(
 
         matched_rule = None  # used only for logging string-rule matches
 
-        # Normalize UI rule type to organiser expected values
-        if isinstance(rules, list):
-            for rule in rules:
-                ui_rule_mode = rule.get("type", "").strip().lower()
-                if ui_rule_mode == "starts with":
-                    rule["type"] = "starts_with"
-                elif ui_rule_mode == "contains":
-                    rule["type"] = "contains"
-
-
         # ----------------------------------------------------------
         # Skip files inside thumbnail folders
         # ----------------------------------------------------------
-        if isinstance(item, dict) and "frames" in item:
-            # Use the first frame to determine sequence location
-            item_path = Path(item["folder"])
-        else:
-            item_path = Path(item)
-
         if config.ignore_thumbnail_folders:
-            if config.thumb_folder_name in item_path.parts:
+            if isinstance(item, dict) and "frames" in item:
+                # Use the sequence folder to determine its location
+                item_path = os.fspath(item["folder"])
+            else:
+                item_path = os.fspath(item)
+
+            if path_has_component(item_path, config.thumb_folder_name):
                 if config.verbose:
                     print(f'skipping thumbnail item: "{item_path}"')
                 continue
@@ -186,18 +180,9 @@ def organise_files(
 
             # Determine folder based on string rules if enabled
             if mode == "string_rule":
-                for rule in (rules or []):
-                    rule_type = rule.get("type")
-                    rule_value = rule.get("value", "").lower()
-
-                    if rule_type == "contains" and rule_value in seq_name_lower:
-                        destination_folder = rule_value
-                        matched_rule = f'contains "{rule_value}"'
-                        break
-                    elif rule_type == "starts_with" and seq_name_lower.startswith(rule_value):
-                        destination_folder = rule_value
-                        matched_rule = f'starts_with "{rule_value}"'
-                        break
+                destination_folder, matched_rule = _match_string_rules(
+                    seq_name_lower, string_rules
+                )
 
                 if not destination_folder:
                     destination_folder = default_folder
@@ -209,12 +194,11 @@ def organise_files(
                 else:
                     destination_folder = default_folder
 
-            # Determine folder based on media type metadata
+            # Determine folder based on media type: frame sequences are
+            # always video (same as extract_metadata() reports for them),
+            # so no frame needs to be read
             elif mode == "media_type":
-                metadata = extract_metadata(item)
-                destination_folder = metadata.get("media_type", "other")
-                if destination_folder not in ["image", "video", "audio", "other"]:
-                    destination_folder = "other"
+                destination_folder = "video"
 
             else:
                 raise ValueError(f"unknown organise mode: {mode}")
@@ -285,22 +269,9 @@ def organise_files(
             # String rule mode
             # ------------------------------------------------------
             if mode == "string_rule":
-                for rule in (rules or []):
-                    rule_type = rule.get("type")
-                    rule_value = rule.get("value", "").lower()
-
-                    if rule_type == "contains" and rule_value in file_name_lower:
-                        destination_folder = rule_value
-                        matched_rule = f'contains "{rule_value}"'
-                        break
-
-                    elif (
-                        rule_type == "starts_with"
-                        and file_name_lower.startswith(rule_value)
-                    ):
-                        destination_folder = rule_value
-                        matched_rule = f'starts_with "{rule_value}"'
-                        break
+                destination_folder, matched_rule = _match_string_rules(
+                    file_name_lower, string_rules
+                )
 
                 if not destination_folder:
                     destination_folder = default_folder
@@ -309,20 +280,17 @@ def organise_files(
             # Extension-based mode
             # ------------------------------------------------------
             elif mode == "extension":
-                if file_path.suffix:
-                    destination_folder = file_path.suffix.lower().lstrip(".")
-                else:
-                    destination_folder = default_folder
+                destination_folder = file_extension(file_path.name) or default_folder
 
             # ------------------------------------------------------
             # Media-type-based mode
             # ------------------------------------------------------
             elif mode == "media_type":
-                metadata = extract_metadata(file_path)
-                destination_folder = metadata.get("media_type", "other")
-
-                if destination_folder not in ["image", "video", "audio", "other"]:
-                    destination_folder = "other"
+                # Media type depends only on the extension, so no metadata
+                # (Pillow/ffprobe) read is needed here
+                destination_folder = EXT_MEDIA_LUT.get(
+                    file_path.suffix.lower(), "other"
+                )
 
             else:
                 raise ValueError(f"unknown organise mode: {mode}")
@@ -375,3 +343,73 @@ def organise_files(
         f"folders created: {len(created_folders)} -> "
         f"{', '.join(sorted(created_folders))}"
     )
+
+
+# ----------------------------------------------------------------------
+# String rule helpers
+# ----------------------------------------------------------------------
+
+# UI labels mapped to organiser rule types
+_RULE_TYPE_ALIASES = {
+    "starts with": "starts_with",
+    "contains": "contains",
+}
+
+
+def _compile_string_rules(rules):
+    """
+    Normalise string rules once per organise run.
+
+    Args:
+        rules (list[dict] | None): Rules like {"type": "contains", "value": "SEF"}.
+            UI labels ("starts with") are accepted as rule types.
+
+    Returns:
+        tuple: (ordered_rules, prefilter) where ordered_rules is a tuple of
+        (rule_type, lowercase_value) pairs in the original rule order and
+        prefilter is a compiled regex matching any rule, or None when
+        there are no rules.
+
+    Notes:
+        - The caller's rule dicts are not modified.
+        - The prefilter only rejects names that match no rule; the first
+          matching rule is still chosen in rule order.
+    """
+    ordered_rules = []
+    for rule in rules or []:
+        rule_type = rule.get("type")
+        rule_type = _RULE_TYPE_ALIASES.get(
+            (rule_type or "").strip().lower(), rule_type
+        )
+        ordered_rules.append((rule_type, rule.get("value", "").lower()))
+
+    patterns = [
+        ("^" if rule_type == "starts_with" else "") + re.escape(value)
+        for rule_type, value in ordered_rules
+        if rule_type in ("contains", "starts_with")
+    ]
+    prefilter = re.compile("|".join(patterns)) if patterns else None
+
+    return tuple(ordered_rules), prefilter
+
+
+def _match_string_rules(name_lower, string_rules):
+    """
+    Find the first string rule matching a lowercase file or sequence name.
+
+    Returns:
+        tuple[str | None, str | None]: (destination_folder, matched_rule label),
+        or (None, None) when no rule matches.
+    """
+    ordered_rules, prefilter = string_rules
+
+    if prefilter is None or prefilter.search(name_lower) is None:
+        return None, None
+
+    for rule_type, rule_value in ordered_rules:
+        if rule_type == "contains" and rule_value in name_lower:
+            return rule_value, f'contains "{rule_value}"'
+        elif rule_type == "starts_with" and name_lower.startswith(rule_value):
+            return rule_value, f'starts_with "{rule_value}"'
+
+    return None, None
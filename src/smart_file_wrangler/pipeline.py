@@ -26,12 +26,11 @@ from pathlib import Path
 # ----------------------------------------------------------------------
 # Local imports
 # ----------------------------------------------------------------------
+# Stage modules (thumbnailer, organiser, metadata_reader, report_writer)
+# are imported inside the stage that uses them, so a run that skips a
+# stage never loads its dependencies (Pillow, openpyxl).
 from .file_scanner import scan_folder
 from .utils import group_frame_sequences
-from .thumbnailer import (generate_thumbnail_for_sequence, create_thumbnail)
-from .organiser import organise_files
-from .metadata_reader import extract_metadata
-from .report_writer import generate_reports
 from .logger import log
 
 
@@ -51,13 +50,16 @@ def _scan_once(folder_path, config, ignore_thumbnails):
 # Public API
 # ----------------------------------------------------------------------
 
-def run_pipeline(folder_path, config=None):
+def run_pipeline(folder_path, config=None, progress_cb=None):
     """
     Run the Smart File Wrangler pipeline on a folder.
 
     Args:
         folder_path (str | Path): Folder to process.
         config (Config): Config object passed by CLI.
+        progress_cb (callable | None): Optional progress_cb(done, total),
+            called as the thumbnail and report stages work through their
+            items. Each stage starts again from 0 with its own total.
 
     Notes:
         - `folder_path` is converted to a Path internally.
@@ -91,15 +93,22 @@ def run_pipeline(folder_path, config=None):
     # 1) Thumbnail generation
     # --------------------------------------------------------------
     if config.generate_thumbnails:
+        from .thumbnailer import generate_thumbnail_for_sequence, create_thumbnail
+
         log("Starting Thumbnails", level="INFO")
         files = _scan_once(folder_path, config, ignore_thumbnails)
         items = group_frame_sequences(files)
+        total = len(items)
+        if progress_cb is not None:
+            progress_cb(0, total)
 
-        for item in items:
+        for done, item in enumerate(items, start=1):
             if isinstance(item, dict):
                 generate_thumbnail_for_sequence(item, config=config)
             else:
                 create_thumbnail(item, config=config)
+            if progress_cb is not None:
+                progress_cb(done, total)
 
         log("Thumbnails Complete", level="INFO")
 
@@ -108,6 +117,8 @@ def run_pipeline(folder_path, config=None):
     # 2) File organisation
     # --------------------------------------------------------------
     if config.enable_organiser:
+        from .organiser import organise_files
+
         log("Starting Organiser", level="INFO")
         # reuse existing items if already scanned, otherwise scan once
         if 'items' not in locals():
@@ -123,6 +134,9 @@ def run_pipeline(folder_path, config=None):
     # 3) Report generation
     # --------------------------------------------------------------
     if (config.output_csv or config.output_json or config.output_tree or config.output_excel):
+        from .metadata_reader import extract_metadata
+        from .report_writer import generate_reports
+
         log("Starting Reports", level="INFO")
         # Re-scan AFTER organiser has run so reports see new file locations (behavior preserved)
         files = scan_folder(
@@ -136,9 +150,15 @@ def run_pipeline(folder_path, config=None):
         items = group_frame_sequences(files)  # one grouping pass
 
         # Extract metadata for each item
+        total = len(items)
+        if progress_cb is not None:
+            progress_cb(0, total)
+
         metadata = []
-        for item in items:
+        for done, item in enumerate(items, start=1):
             metadata.append(extract_metadata(item))
+            if progress_cb is not None:
+                progress_cb(done, total)
 
         # Resolve report output directory
         output_dir = config.report_output_dir or folder_path
@@ -24,13 +24,14 @@ import json
 from pathlib import Path
 from collections import defaultdict
 
-from openpyxl import Workbook
-from openpyxl.utils import get_column_letter
+# openpyxl is imported inside write_excel_report(), so CSV/JSON/tree-only
+# runs never load it
 
 # ----------------------------------------------------------------------
 # Local imports
 # ----------------------------------------------------------------------
 from .media_item import MediaItem
+from .utils import path_has_component
 
 
 # ----------------------------------------------------------------------
@@ -213,7 +214,7 @@ def write_json_report(data, output_path, root_folder, config):
 
         filtered = {
             field_name: prepared.get(field_name)
-            for field_name in ["filename"] + config.metadata_fields
+            for field_name in ("filename", *config.metadata_fields)
             if field_name in prepared
         }
 
@@ -294,7 +295,7 @@ def write_folder_tree(items, output_path, root_folder, config):
         relative_path = Path(item["file_path"]).relative_to(root_folder)
 
         # Skip thumbnail folders entirely
-        if thumb_folder in relative_path.parts:
+        if path_has_component(str(relative_path), thumb_folder):
             continue
 
         new_item = dict(item)
@@ -326,6 +327,9 @@ def write_excel_report(data, output_path, root_folder, config):
     - relative file_path
     - human-readable file_size
     """
+    from openpyxl import Workbook
+    from openpyxl.utils import get_column_letter
+
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
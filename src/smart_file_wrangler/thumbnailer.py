@@ -259,7 +259,7 @@ def generate_thumbnail_for_sequence(sequence_dict, config=None):
 # ----------------------------------------------------------------------
 
 if __name__ == "__main__":
-    from .config import Config
+    from .config import Config, MediaType
     from .utils import scan_folder, group_frame_sequences
     # MANUAL TEST ONLY — uses literal Config values, no Defaults dependency, no pipeline impact
 
@@ -278,7 +278,7 @@ if __name__ == "__main__":
         thumb_size=400,
         thumb_suffix="_thumb",
         thumb_folder_name="thumbnails",
-        include_media_types={"image": True, "video": True, "audio": True, "other": True},
+        media_mask=MediaType.ALL,
         metadata_fields=["file_path", "file_size_bytes", "media_type", "extension", "resolution_px", "duration_seconds", "sample_rate_hz", "mode", "format"],
         metadata_sort_by="file_size_bytes",
         metadata_sort_reverse=False,
@@ -17,7 +17,10 @@ Responsibilities:
 # Standard library imports
 # ----------------------------------------------------------------------
 
+import os
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 import subprocess
 import re
 from collections import defaultdict
@@ -26,27 +29,37 @@ from collections import defaultdict
 # Local imports
 # ----------------------------------------------------------------------
 
-from .config import Config as WranglerConfig
+from .config import Config as WranglerConfig, METADATA_FIELDS
 
 
 # ----------------------------------------------------------------------
 # Media file extension groups
 # ----------------------------------------------------------------------
-# These lists define known media extensions and are used for basic
+# These sets define known media extensions and are used for basic
 # classification and filtering. They are not intended to be exhaustive.
+# frozensets keep the per-file `extension in ...` checks O(1).
 
-image_extensions = [
+image_extensions = frozenset({
     ".png", ".jpg", ".jpeg", ".tif", ".tiff", ".bmp", ".gif",
     ".exr", ".dpx", ".cin", ".tga", ".hdr", ".sgi", ".rgb"
-]
+})
 
-video_extensions = [
+video_extensions = frozenset({
     ".mp4", ".mov", ".avi", ".mkv", ".flv", ".webm"
-]
+})
 
-audio_extensions = [
+audio_extensions = frozenset({
     ".wav", ".mp3", ".aac", ".flac"
-]
+})
+
+# Extension (lowercase, with leading dot) -> media type name.
+# Built once from the groups above so classification is a single lookup;
+# read-only so callers cannot change it for other modules.
+EXT_MEDIA_LUT = MappingProxyType({
+    **dict.fromkeys(image_extensions, "image"),
+    **dict.fromkeys(video_extensions, "video"),
+    **dict.fromkeys(audio_extensions, "audio"),
+})
 
 
 # ----------------------------------------------------------------------
@@ -68,6 +81,47 @@ def ensure_directory(path):
         path.mkdir(parents=True, exist_ok=True)
 
 
+def file_extension(file_name):
+    """
+    Return the lowercase extension of a file name, without the dot.
+
+    Args:
+        file_name (str): File name (not a full path).
+
+    Returns:
+        str: Same result as Path(file_name).suffix.lower().lstrip(".")
+        without building a Path: "" for names with no dot, a leading dot
+        only (".hidden") or a trailing dot ("name.").
+
+    Notes:
+        - Uses one rfind; only the extension tail is sliced and lowercased.
+        - str.rpartition(".") is not used because it would treat ".hidden"
+          as having the extension "hidden".
+    """
+    dot = file_name.rfind(".")
+    if 0 < dot < len(file_name) - 1:
+        return file_name[dot + 1:].lower()
+    return ""
+
+
+def path_has_component(path, name):
+    """
+    Check whether a folder or file name is one of the components of a path.
+
+    Args:
+        path (str): Path string using os.sep (as produced by str(Path) or
+            os.scandir).
+        name (str | None): Component to look for, e.g. the thumbnail folder.
+
+    Returns:
+        bool: Same result as `name in Path(path).parts`, without building
+        a Path. A substring test rejects most paths before any splitting.
+    """
+    if not name or name not in path:
+        return False
+    return name in path.split(os.sep)
+
+
 def get_thumbnail_path(file_path: Path, thumb_folder_name="thumbnails", thumb_suffix="_thumb", thumb_ext=".png") -> Path:
     """
     Generate the output path for a thumbnail corresponding to a media file.
@@ -82,15 +136,13 @@ def get_thumbnail_path(file_path: Path, thumb_folder_name="thumbnails", thumb_su
         Path: Full path to the thumbnail file.
 
     Notes:
-        - If thumb_folder_name or thumb_suffix is None, values are read from
-          config.Defaults.
-        - This creates an implicit dependency on Defaults, which is intentional
-          but should be kept in mind when reusing this function.
+        - If thumb_folder_name or thumb_suffix is None, the Config defaults
+          are used.
     """
     if thumb_folder_name is None:
-        thumb_folder_name = WranglerConfig().include_media_types.get("thumb_folder_name", "thumbnails")
+        thumb_folder_name = WranglerConfig().thumb_folder_name
     if thumb_suffix is None:
-        thumb_suffix = WranglerConfig().include_media_types.get("thumb_suffix", "_thumb")
+        thumb_suffix = WranglerConfig().thumb_suffix
 
 
     thumb_dir = file_path.parent / thumb_folder_name
@@ -103,6 +155,7 @@ def get_thumbnail_path(file_path: Path, thumb_folder_name="thumbnails", thumb_su
 # Environment and dependency checks
 # ----------------------------------------------------------------------
 
+@lru_cache(maxsize=1)
 def is_ffmpeg_available():
     """
     Check whether ffmpeg or ffprobe is available on the system.
@@ -115,6 +168,10 @@ def is_ffmpeg_available():
 
     Any exceptions raised by subprocess execution are caught internally,
     and the function fails safely by returning False.
+
+    The result is cached for the process, so metadata and thumbnail code
+    can call this per file without spawning ffmpeg each time. Call
+    is_ffmpeg_available.cache_clear() after installing ffmpeg.
     """
     for command in ("ffmpeg", "ffprobe"):
         try:
@@ -142,7 +199,7 @@ def filter_metadata(metadata: dict, fields: list = None) -> dict:
     Args:
         metadata (dict): Full metadata dictionary.
         fields (list, optional): List of keys to retain. If None, defaults
-            to `Config.metadata_fields` via WranglerConfig().
+            to the default `Config.metadata_fields` (METADATA_FIELDS).
 
     Returns:
         dict: Filtered metadata dictionary containing only requested keys.
@@ -150,10 +207,9 @@ def filter_metadata(metadata: dict, fields: list = None) -> dict:
     Notes:
         - Missing keys are silently ignored.
         - No validation of field names is performed.
-        - If fields is None, this function implicitly depends on Defaults.
     """
     if fields is None:
-        fields = WranglerConfig().metadata_fields
+        fields = METADATA_FIELDS
 
     return {key: value for key, value in metadata.items() if key in fields}
 
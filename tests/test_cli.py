@@ -0,0 +1,87 @@
+"""
+test_cli.py
+Checks that cli._fast_parse() stays in sync with the argparse definition.
+
+_fast_parse() mirrors the parser by hand (_FAST_FLAGS), so every option
+registered by _build_parser() must parse to the same namespace on both
+paths. Runs under pytest, or directly as a script.
+"""
+
+import sys
+from pathlib import Path
+
+# add src folder to the module search path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from smart_file_wrangler import cli
+
+
+def _parser_options():
+    """Option actions registered by _build_parser() (help excluded)."""
+    parser = cli._build_parser(with_help=False)
+    return parser, [action for action in parser._actions if action.option_strings]
+
+
+def _sample_argvs(action):
+    """Representative argv fragments that exercise one option."""
+    for flag in action.option_strings:
+        if action.nargs == 0:
+            yield [flag]
+        elif action.choices:
+            for choice in action.choices:
+                yield [flag, choice]
+        elif action.type is int:
+            yield [flag, "64"]
+        elif isinstance(action.default, list):
+            yield [flag, "a", flag, "b"]
+        else:
+            yield [flag, "value"]
+
+
+def test_fast_flags_match_parser_options():
+    _, actions = _parser_options()
+    parser_flags = {flag for action in actions for flag in action.option_strings}
+    assert parser_flags == set(cli._FAST_FLAGS)
+
+
+def test_fast_parse_matches_argparse_per_option():
+    parser, actions = _parser_options()
+    for action in actions:
+        for fragment in _sample_argvs(action):
+            argv = fragment if action.dest == "input" else ["-i", "in"] + fragment
+            fast = cli._fast_parse(argv)
+            assert fast is not None, argv
+            assert vars(fast) == vars(parser.parse_args(argv)), argv
+
+
+def test_fast_parse_matches_argparse_combined():
+    parser, _ = _parser_options()
+    argv = [
+        "--input", "in", "-o", "out", "--organise", "--move",
+        "--organise-by", "string_rule", "--contains", "a", "--starts-with", "b",
+        "--contains", "c", "--subfolders", "--report-format", "all",
+        "--folder-tree", "--thumbnails", "--thumb-size", "128", "--verbose",
+        "--report-only",
+    ]
+    assert vars(cli._fast_parse(argv)) == vars(parser.parse_args(argv))
+
+
+def test_fast_parse_defers_unusual_input():
+    for argv in (
+        [],
+        ["-i"],
+        ["-i=x"],
+        ["--verb", "-i", "x"],
+        ["-i", "x", "--report-format", "bad"],
+        ["-i", "x", "--thumb-size", "big"],
+        ["-i", "x", "--report-only", "--thumbnails-only"],
+        ["-i", "x", "--help"],
+    ):
+        assert cli._fast_parse(argv) is None, argv
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"ok: {name}")
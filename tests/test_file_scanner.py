@@ -0,0 +1,56 @@
+"""
+test_file_scanner.py
+Checks that FileScanner.refresh() drops cached listings whether the folder
+is spelled as a relative or an absolute path. Runs under pytest, or
+directly as a script.
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# add src folder to the module search path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from smart_file_wrangler.config import Config
+from smart_file_wrangler.file_scanner import FileScanner
+
+
+def _rescan_after_refresh(scan_as, refresh_as):
+    """Scan, add a file, refresh with the other spelling, scan again."""
+    config = Config(file_types=("txt",))
+    old_cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as parent:
+        os.chdir(parent)
+        try:
+            os.mkdir("shots")
+            Path("shots", "a.txt").write_text("a")
+            absolute = os.path.join(os.path.realpath(parent), "shots")
+            spelling = {"relative": "shots", "absolute": absolute}
+
+            scanner = FileScanner()
+            first = scanner.scan_folder(spelling[scan_as], config=config)
+            Path("shots", "b.txt").write_text("b")
+            scanner.refresh(spelling[refresh_as])
+            second = scanner.scan_folder(spelling[scan_as], config=config)
+        finally:
+            os.chdir(old_cwd)
+
+    assert [path.name for path in first] == ["a.txt"]
+    assert [path.name for path in second] == ["a.txt", "b.txt"]
+
+
+def test_refresh_absolute_after_relative_scan():
+    _rescan_after_refresh("relative", "absolute")
+
+
+def test_refresh_relative_after_absolute_scan():
+    _rescan_after_refresh("absolute", "relative")
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"ok: {name}")